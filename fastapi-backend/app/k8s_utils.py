@@ -1,41 +1,102 @@
 # app/k8s_utils.py
-from kubernetes import client, config as k8s_config
+from kubernetes import client, config as k8s_config, watch
 from kubernetes.client.rest import ApiException
 from urllib3.exceptions import MaxRetryError, NewConnectionError # Import from urllib3
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 from .models import NextJSDeploymentConfig 
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+import asyncio
 import datetime
+import functools
+import logging
 import os
+import socket
+import threading
+import time
+
+log = logging.getLogger(__name__)
 
 # --- Kubernetes Configuration ---
-KUBE_CONFIG_LOADED = False
-try:
-    kubeconfig_path = os.getenv("KUBECONFIG")
-    if kubeconfig_path:
-        print(f"Attempting to load kubeconfig from KUBECONFIG env var: {kubeconfig_path}")
-        k8s_config.load_kube_config(config_file=kubeconfig_path)
-    else:
-        print("KUBECONFIG env var not set, trying default kubeconfig path.")
-        k8s_config.load_kube_config()
-    KUBE_CONFIG_LOADED = True
-    print("Successfully loaded kubeconfig for k8s_utils.")
-except k8s_config.ConfigException as e1:
-    print(f"Could not load kubeconfig: {e1}. Trying in-cluster config...")
+# urllib3 keeps only 4 connections per pool by default, which saturates under concurrent
+# status polls and deploys ("Connection pool is full, discarding connection").
+K8S_POOL_MAXSIZE = int(os.getenv("K8S_POOL_MAXSIZE", "50"))
+
+# TCP keep-alive so pooled apiserver connections survive the gaps between dashboard polls instead of
+# being dropped by NAT/load balancers and paying a fresh TCP+TLS handshake. The fine-grained timers
+# are Linux-only, hence the hasattr checks.
+_KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+for _opt, _value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+    if hasattr(socket, _opt):
+        _KEEPALIVE_SOCKET_OPTIONS.append((socket.IPPROTO_TCP, getattr(socket, _opt), _value))
+
+def _get_k8s_configuration() -> client.Configuration:
+    cfg = client.Configuration.get_default_copy()
+    cfg.connection_pool_maxsize = K8S_POOL_MAXSIZE
+    cfg.socket_options = _KEEPALIVE_SOCKET_OPTIONS
+    # Ride out transient apiserver blips (rolling restarts, resets) instead of surfacing them as errors.
+    # The PATCH bodies sent by apply_mi_configuration set absolute values, so retrying them is safe.
+    # raise_on_status=False lets a final 5xx still surface as an ApiException rather than MaxRetryError.
+    cfg.retries = Retry(
+        total=3, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "PATCH"]), raise_on_status=False,
+    )
+    return cfg
+
+K8sClients = namedtuple("K8sClients", ["api_client", "apps", "autoscaling", "custom"])
+
+def _load_kube_config() -> bool:
     try:
-        k8s_config.load_incluster_config()
-        KUBE_CONFIG_LOADED = True
-        print("Successfully loaded in-cluster config for k8s_utils.")
-    except k8s_config.ConfigException as e2:
-        print(f"Could not load in-cluster config: {e2}.")
-
-if KUBE_CONFIG_LOADED:
-    apps_v1_api = client.AppsV1Api()
-    autoscaling_v2_api = client.AutoscalingV2Api()
-    custom_objects_api = client.CustomObjectsApi()
-else:
-    apps_v1_api = None
-    autoscaling_v2_api = None
-    custom_objects_api = None
-    print("WARNING: Kubernetes API clients not initialized due to config loading failure.")
+        kubeconfig_path = os.getenv("KUBECONFIG")
+        if kubeconfig_path:
+            log.info("Attempting to load kubeconfig from KUBECONFIG env var: %s", kubeconfig_path)
+            k8s_config.load_kube_config(config_file=kubeconfig_path)
+        else:
+            log.info("KUBECONFIG env var not set, trying default kubeconfig path.")
+            k8s_config.load_kube_config()
+        log.info("Successfully loaded kubeconfig for k8s_utils.")
+        return True
+    except k8s_config.ConfigException as e1:
+        log.info("Could not load kubeconfig: %s. Trying in-cluster config...", e1)
+        try:
+            k8s_config.load_incluster_config()
+            log.info("Successfully loaded in-cluster config for k8s_utils.")
+            return True
+        except k8s_config.ConfigException as e2:
+            log.warning("Could not load in-cluster config: %s.", e2)
+            return False
+
+# Config is loaded and the clients built on first use rather than at import, so importing this module
+# (uvicorn reload, tooling) never touches the filesystem or network. Returns None if no config is found.
+# One ApiClient (and so one urllib3 PoolManager) is shared by every API wrapper, so the apps/v1,
+# autoscaling/v2 and metrics.k8s.io calls reuse the same keep-alive connections to the apiserver.
+@functools.lru_cache(maxsize=1)
+def _get_clients() -> K8sClients | None:
+    if not _load_kube_config():
+        log.warning("Kubernetes API clients not initialized due to config loading failure.")
+        return None
+    api_client = client.ApiClient(configuration=_get_k8s_configuration())
+    return K8sClients(
+        api_client=api_client,
+        apps=client.AppsV1Api(api_client),
+        autoscaling=client.AutoscalingV2Api(api_client),
+        custom=client.CustomObjectsApi(api_client),
+    )
+
+def kube_config_loaded() -> bool:
+    return _get_clients() is not None
+
+# The kubernetes client is synchronous (urllib3), so its calls run on a dedicated thread pool sized to
+# the connection pool: an in-flight call never waits for a pooled connection, and K8s calls don't
+# compete with other blocking work on the event loop's default executor.
+_K8S_EXECUTOR = ThreadPoolExecutor(max_workers=K8S_POOL_MAXSIZE, thread_name_prefix="k8s-api")
+
+async def _run_k8s(func, /, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_K8S_EXECUTOR, functools.partial(func, **kwargs))
 
 # --- Constants ---
 NAMESPACE = "default"
@@ -46,172 +107,325 @@ MI_APP_LABEL = "wso2mi"
 # The environment variable name that your WSO2 MI Synapse configuration reads for the delay
 MI_EXPECTED_DELAY_ENV_VAR = "BACKEND_DELAY"
 
+# Static apiserver call arguments, built once instead of on every request.
+# Every call carries a client-side _request_timeout: the caller's asyncio timeout only stops the waiting,
+# and without one a hung apiserver would hold a _K8S_EXECUTOR thread indefinitely.
+# The two PATCHes run back to back, so together they fit inside the /api/deploy-mi timeout.
+PATCH_TIMEOUT_SECONDS = 10
+_DEPLOYMENT_KWARGS = dict(name=MI_DEPLOYMENT_NAME, namespace=NAMESPACE, _request_timeout=PATCH_TIMEOUT_SECONDS)
+_HPA_KWARGS = dict(name=MI_HPA_NAME, namespace=NAMESPACE, _request_timeout=PATCH_TIMEOUT_SECONDS)
+# Status reads list by field selector with resourceVersion="0", which the apiserver serves from its
+# watch cache instead of a quorum read from etcd. Sub-second staleness is fine for a dashboard; the
+# PATCHes in apply_mi_configuration are unaffected.
+STATUS_READ_TIMEOUT_SECONDS = 5
+_DEPLOYMENT_STATUS_LIST_KWARGS = dict(
+    namespace=NAMESPACE, field_selector=f"metadata.name={MI_DEPLOYMENT_NAME}",
+    resource_version="0", _request_timeout=STATUS_READ_TIMEOUT_SECONDS,
+)
+_HPA_STATUS_LIST_KWARGS = dict(
+    namespace=NAMESPACE, field_selector=f"metadata.name={MI_HPA_NAME}",
+    resource_version="0", _request_timeout=STATUS_READ_TIMEOUT_SECONDS,
+)
+_METRICS_KWARGS = dict(
+    group="metrics.k8s.io", version="v1beta1",
+    namespace=NAMESPACE, plural="pods", label_selector=f"app={MI_APP_LABEL}",
+    _request_timeout=STATUS_READ_TIMEOUT_SECONDS,
+)
+
 async def apply_mi_configuration(payload: NextJSDeploymentConfig) -> dict:
-    if not KUBE_CONFIG_LOADED or not apps_v1_api or not autoscaling_v2_api:
+    clients = _get_clients()
+    if clients is None:
         raise ValueError("Kubernetes client not initialized. Check K8s configuration.")
 
     deployment_details = {}
     hpa_details = {}
 
     try:
-        current_deployment = apps_v1_api.read_namespaced_deployment(name=MI_DEPLOYMENT_NAME, namespace=NAMESPACE)
-        
-        if current_deployment.spec.template.spec.containers:
-            for container in current_deployment.spec.template.spec.containers:
-                if container.name == MI_CONTAINER_NAME:
-                    container.resources.requests = {"cpu": payload.cpuRequest, "memory": payload.memoryRequest}
-                    container.resources.limits = {"cpu": payload.cpuLimit, "memory": payload.memoryLimit}
-                    
-                    env_var_exists = False
-                    if container.env:
-                        for env_var in container.env:
-                            if env_var.name == MI_EXPECTED_DELAY_ENV_VAR: # Use the defined constant
-                                env_var.value = str(payload.backendDelayMs)
-                                env_var_exists = True
-                                break
-                        if not env_var_exists:
-                            container.env.append(client.V1EnvVar(name=MI_EXPECTED_DELAY_ENV_VAR, value=str(payload.backendDelayMs)))
-                    else:
-                        container.env = [client.V1EnvVar(name=MI_EXPECTED_DELAY_ENV_VAR, value=str(payload.backendDelayMs))]
-                    break 
-        
-        apps_v1_api.patch_namespaced_deployment(name=MI_DEPLOYMENT_NAME, namespace=NAMESPACE, body=current_deployment)
+        # Strategic merge patch: containers and env entries are merged by name, so only the MI
+        # container's resources and delay variable change and nothing else needs to be read first.
+        deployment_patch = {"spec": {"template": {"spec": {"containers": [{
+            "name": MI_CONTAINER_NAME,
+            "resources": {
+                "requests": {"cpu": payload.cpuRequest, "memory": payload.memoryRequest},
+                "limits": {"cpu": payload.cpuLimit, "memory": payload.memoryLimit},
+            },
+            "env": [{"name": MI_EXPECTED_DELAY_ENV_VAR, "value": str(payload.backendDelayMs)}],
+        }]}}}}
+        await _run_k8s(clients.apps.patch_namespaced_deployment, **_DEPLOYMENT_KWARGS, body=deployment_patch)
         deployment_details = {"status": "patched", "name": MI_DEPLOYMENT_NAME}
-        print(f"Patched Deployment '{MI_DEPLOYMENT_NAME}'.")
+        log.info("Patched Deployment '%s'.", MI_DEPLOYMENT_NAME)
 
     except ApiException as e:
         if e.status == 404:
             raise ValueError(f"MI Deployment '{MI_DEPLOYMENT_NAME}' not found.") from e
         raise ValueError(f"Error patching MI Deployment: {e.reason}") from e
     except (MaxRetryError, NewConnectionError) as e:
-        print(f"K8s API connection error during MI Deployment patch: {e}")
+        log.error("K8s API connection error during MI Deployment patch: %s", e)
         raise ValueError(f"Kubernetes API connection failed: {str(e)}") from e
     except Exception as e:
-        print(f"Unexpected error during MI Deployment configuration: {e}")
+        log.exception("Unexpected error during MI Deployment configuration: %s", e)
         raise ValueError(f"Unexpected error configuring MI Deployment: {str(e)}") from e
 
     try:
-        current_hpa = autoscaling_v2_api.read_namespaced_horizontal_pod_autoscaler(name=MI_HPA_NAME, namespace=NAMESPACE)
-        current_hpa.spec.min_replicas = payload.minReplicas
-        current_hpa.spec.max_replicas = payload.maxReplicas
-        autoscaling_v2_api.patch_namespaced_horizontal_pod_autoscaler(name=MI_HPA_NAME, namespace=NAMESPACE, body=current_hpa)
+        hpa_patch = {"spec": {"minReplicas": payload.minReplicas, "maxReplicas": payload.maxReplicas}}
+        await _run_k8s(clients.autoscaling.patch_namespaced_horizontal_pod_autoscaler, **_HPA_KWARGS, body=hpa_patch)
         hpa_details = {"status": "patched", "name": MI_HPA_NAME}
-        print(f"Patched HPA '{MI_HPA_NAME}'.")
+        log.info("Patched HPA '%s'.", MI_HPA_NAME)
 
     except ApiException as e:
         if e.status == 404:
             raise ValueError(f"MI HPA '{MI_HPA_NAME}' not found.") from e
         raise ValueError(f"Error patching HPA: {e.reason}") from e
     except (MaxRetryError, NewConnectionError) as e:
-        print(f"K8s API connection error during HPA patch: {e}")
+        log.error("K8s API connection error during HPA patch: %s", e)
         raise ValueError(f"Kubernetes API connection failed: {str(e)}") from e
     except Exception as e:
-        print(f"Unexpected error during HPA configuration: {e}")
+        log.exception("Unexpected error during HPA configuration: %s", e)
         raise ValueError(f"Unexpected error configuring HPA: {str(e)}") from e
             
     return {"deployment": deployment_details, "hpa": hpa_details}
 
+# Millicores per unit for each CPU quantity suffix Metrics Server emits (milli-, nano-, microcores).
+_CPU_SUFFIX_TO_MILLICORES = {"m": 1.0, "n": 1e-6, "u": 1e-3}
+
 def parse_cpu_value(cpu_str: str) -> float:
-    if not cpu_str: return 0.0
-    if cpu_str.endswith('m'): return float(cpu_str[:-1])
-    if cpu_str.endswith('n'): return float(cpu_str[:-1]) / 1_000_000
-    try: return float(cpu_str) * 1000
+    """Convert a Kubernetes CPU quantity (e.g. '250m', '1', '12345n') to millicores."""
+    if not cpu_str or cpu_str == "0n" or cpu_str == "0": return 0.0
+    multiplier = _CPU_SUFFIX_TO_MILLICORES.get(cpu_str[-1])
+    try:
+        if multiplier is not None: return float(cpu_str[:-1]) * multiplier
+        return float(cpu_str) * 1000
     except ValueError: return 0.0
 
-async def get_mi_status():
-    current_timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
-    default_error_status = {
-        "timestamp": current_timestamp, "error": "Initial error state or K8s client not ready.",
-        "active_pods": 0, "total_cpu_millicores": 0,
-        "hpa_status": {"error": "Not fetched"}, "deployment_status": {"error": "Not fetched"}
-    }
-    
-    if not KUBE_CONFIG_LOADED or not all([apps_v1_api, autoscaling_v2_api, custom_objects_api]):
-        print("get_mi_status: Kubernetes client not initialized. Returning error status.")
-        default_error_status["error"] = "Kubernetes client not initialized on backend. Check K8s configuration and connection."
-        return default_error_status
-
-    active_pods = 0
-    total_cpu_millicores = 0.0
-    hpa_status_data = {"error": None}
-    deployment_status_data = {"error": None}
-    metrics_error_message = None # Specific message for metrics part
+# --- Deployment / HPA watches ---
+# Instead of GETting the deployment and HPA on every status poll, a list+watch loop per object keeps
+# an in-memory copy current, so apiserver load no longer grows with the number of dashboard viewers.
+# Pod metrics still have to be polled: metrics.k8s.io does not support watch.
+WATCH_TIMEOUT_SECONDS = 300
+WATCH_RETRY_DELAY_SECONDS = 5
 
-    try:
-        try:
-            deployment = apps_v1_api.read_namespaced_deployment_status(name=MI_DEPLOYMENT_NAME, namespace=NAMESPACE)
-            active_pods = deployment.status.ready_replicas if deployment.status.ready_replicas is not None else 0
-            deployment_status_data.update({
-                "replicas": deployment.status.replicas if deployment.status.replicas is not None else 0,
-                "readyReplicas": active_pods,
-                "availableReplicas": deployment.status.available_replicas if deployment.status.available_replicas is not None else 0,
-                "updatedReplicas": deployment.status.updated_replicas if deployment.status.updated_replicas is not None else 0,
-            })
-        except ApiException as e:
-            active_pods = 0 
-            if e.status == 404:
-                deployment_status_data["error"] = f"MI Deployment '{MI_DEPLOYMENT_NAME}' not found."
-            else:
-                deployment_status_data["error"] = f"K8s API Error (Deployment): {e.reason} (Status: {e.status})"
-            print(deployment_status_data["error"])
-        
-        try:
-            hpa_spec = autoscaling_v2_api.read_namespaced_horizontal_pod_autoscaler(name=MI_HPA_NAME, namespace=NAMESPACE)
-            hpa_status = autoscaling_v2_api.read_namespaced_horizontal_pod_autoscaler_status(name=MI_HPA_NAME, namespace=NAMESPACE)
-            hpa_status_data.update({
-                "minReplicas": hpa_spec.spec.min_replicas,
-                "maxReplicas": hpa_spec.spec.max_replicas,
-                "currentReplicas": hpa_status.status.current_replicas if hpa_status.status and hpa_status.status.current_replicas is not None else 0,
-                "desiredReplicas": hpa_status.status.desired_replicas if hpa_status.status and hpa_status.status.desired_replicas is not None else 0,
-                "lastScaleTime": hpa_status.status.last_scale_time.isoformat() if hpa_status.status and hpa_status.status.last_scale_time else None,
-            })
-        except ApiException as e:
-            if e.status == 404:
-                hpa_status_data["error"] = f"MI HPA '{MI_HPA_NAME}' not found."
-            else:
-                hpa_status_data["error"] = f"K8s API Error (HPA): {e.reason} (Status: {e.status})"
-            print(hpa_status_data["error"])
+@dataclass
+class _WatchedObject:
+    list_func: Callable
+    name: str
+    obj: Any = None
+    synced: bool = False  # False until the first list succeeds and whenever the watch loop is failing
 
-        if not deployment_status_data.get("error") and active_pods > 0:
+    def run(self, stop_event: threading.Event):
+        field_selector = f"metadata.name={self.name}"
+        resource_version = None
+        while not stop_event.is_set():
             try:
-                pod_metrics_list = custom_objects_api.list_namespaced_custom_object(
-                    group="metrics.k8s.io", version="v1beta1",
-                    namespace=NAMESPACE, plural="pods", label_selector=f"app={MI_APP_LABEL}"
-                )
-                for item in pod_metrics_list.get("items", []):
-                    for container_metrics in item.get("containers", []):
-                        if container_metrics.get("name") == MI_CONTAINER_NAME:
-                            cpu_usage_str = container_metrics.get("usage", {}).get("cpu", "0n")
-                            total_cpu_millicores += parse_cpu_value(cpu_usage_str)
-                            break 
+                if resource_version is None:
+                    listing = self.list_func(namespace=NAMESPACE, field_selector=field_selector, resource_version="0")
+                    self.obj = listing.items[0] if listing.items else None
+                    self.synced = True
+                    resource_version = listing.metadata.resource_version
+                for event in watch.Watch().stream(
+                    self.list_func, namespace=NAMESPACE, field_selector=field_selector,
+                    resource_version=resource_version, timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                ):
+                    obj = event["object"]
+                    resource_version = obj.metadata.resource_version
+                    self.obj = None if event["type"] == "DELETED" else obj
+                    if stop_event.is_set():
+                        break
             except ApiException as e:
-                if e.status == 404:
-                     metrics_error_message = "Pod metrics not found. Ensure Metrics Server is running and MI pods are up with correct labels."
-                else:
-                    metrics_error_message = f"K8s API Error (PodMetrics): {e.reason} (Status: {e.status})."
-                print(metrics_error_message)
-        elif active_pods == 0 and not deployment_status_data.get("error"):
-             metrics_error_message = "No active MI pods to fetch metrics from."
+                if e.status == 410:
+                    # Our resourceVersion is too old for the watch cache; relist from scratch.
+                    resource_version = None
+                    continue
+                log.warning("Watch on '%s' failed: %s (Status: %s). Retrying in %ss.", self.name, e.reason, e.status, WATCH_RETRY_DELAY_SECONDS)
+                self.synced = False
+                resource_version = None
+                stop_event.wait(WATCH_RETRY_DELAY_SECONDS)
+            except Exception as e:
+                log.warning("Watch on '%s' failed: %s. Retrying in %ss.", self.name, e, WATCH_RETRY_DELAY_SECONDS)
+                self.synced = False
+                resource_version = None
+                stop_event.wait(WATCH_RETRY_DELAY_SECONDS)
+
+    def current(self):
+        if self.obj is None:
+            raise ApiException(status=404, reason="Not Found")
+        return self.obj
+
+_deployment_watch: _WatchedObject | None = None
+_hpa_watch: _WatchedObject | None = None
+_watch_stop_event = threading.Event()
+
+def start_status_watches():
+    """Start the deployment and HPA watch loops on daemon threads (called once at app startup)."""
+    global _deployment_watch, _hpa_watch
+    clients = _get_clients()
+    if clients is None:
+        log.warning("Kubernetes client not initialized; status watches not started.")
+        return
+    _deployment_watch = _WatchedObject(list_func=clients.apps.list_namespaced_deployment, name=MI_DEPLOYMENT_NAME)
+    _hpa_watch = _WatchedObject(list_func=clients.autoscaling.list_namespaced_horizontal_pod_autoscaler, name=MI_HPA_NAME)
+    for watched in (_deployment_watch, _hpa_watch):
+        threading.Thread(target=watched.run, args=(_watch_stop_event,), name=f"watch-{watched.name}", daemon=True).start()
+
+def stop_status_watches():
+    _watch_stop_event.set()
+
+def _single_item(listing):
+    if not listing.items:
+        raise ApiException(status=404, reason="Not Found")
+    return listing.items[0]
+
+async def _read_deployment_status(clients: K8sClients):
+    if _deployment_watch and _deployment_watch.synced:
+        return _deployment_watch.current()
+    listing = await _run_k8s(clients.apps.list_namespaced_deployment, **_DEPLOYMENT_STATUS_LIST_KWARGS)
+    return _single_item(listing)
+
+# The plain HPA read already carries .status, so a separate *_status read would be a wasted round-trip.
+async def _read_hpa(clients: K8sClients):
+    if _hpa_watch and _hpa_watch.synced:
+        return _hpa_watch.current()
+    listing = await _run_k8s(clients.autoscaling.list_namespaced_horizontal_pod_autoscaler, **_HPA_STATUS_LIST_KWARGS)
+    return _single_item(listing)
 
+# Metrics Server only scrapes pods every ~15s, so polling metrics.k8s.io faster than that returns the
+# same numbers. The aggregated CPU value is cached for METRICS_TTL seconds, and on a failed refresh the
+# last value keeps being served with "metrics_stale": true.
+_metrics_cache = {"value": 0.0, "ts": None, "ttl": float(os.getenv("METRICS_TTL", "15"))}
 
+def _metrics_cache_fresh() -> bool:
+    return _metrics_cache["ts"] is not None and time.monotonic() - _metrics_cache["ts"] < _metrics_cache["ttl"]
+
+_NO_USAGE = {}  # shared read-only default, avoids allocating an empty dict per container
+
+async def _read_pod_metrics(clients: K8sClients):
+    if _metrics_cache_fresh():
+        return None
+    return await _run_k8s(clients.custom.list_namespaced_custom_object, **_METRICS_KWARGS)
+
+def _raise_unexpected(*results):
+    # ApiExceptions are per-resource and reported inside each section; anything else (connection
+    # failures, bugs) on the deployment/HPA reads aborts the whole status call and is handled by the caller.
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, ApiException):
+            raise result
+
+def _status_failure_message(e: Exception) -> str:
     # Catch specific connection errors from urllib3, which are wrapped by kubernetes.client.exceptions.ApiException
     # but sometimes can be raised directly if the API client fails at a very low level.
-    except (MaxRetryError, NewConnectionError) as e:
+    if isinstance(e, (MaxRetryError, NewConnectionError)):
         error_msg = f"Kubernetes API connection failed: {type(e).__name__} - {str(e)}. Check K8s cluster reachability."
-        print(error_msg)
-        default_error_status["error"] = error_msg
-        return default_error_status
-    except ApiException as e: # Catch K8s API exceptions not handled by specific resource try-excepts
+        log.error(error_msg)
+    elif isinstance(e, ApiException): # K8s API exceptions not handled by the per-resource sections
         error_msg = f"Kubernetes API call failed: {e.reason} (Status: {e.status})"
-        print(error_msg)
-        default_error_status["error"] = error_msg
+        log.error(error_msg)
+    else:
+        error_msg = f"Unexpected backend error in get_mi_status: {str(e)}"
+        log.exception(error_msg)
+    return error_msg
+
+def _deployment_status_section(deployment) -> tuple[dict, int]:
+    deployment_status_data = {"error": None}
+    if isinstance(deployment, ApiException):
+        e = deployment
+        if e.status == 404:
+            deployment_status_data["error"] = f"MI Deployment '{MI_DEPLOYMENT_NAME}' not found."
+        else:
+            deployment_status_data["error"] = f"K8s API Error (Deployment): {e.reason} (Status: {e.status})"
+        log.warning(deployment_status_data["error"])
+        return deployment_status_data, 0
+
+    active_pods = deployment.status.ready_replicas if deployment.status.ready_replicas is not None else 0
+    deployment_status_data.update({
+        "replicas": deployment.status.replicas if deployment.status.replicas is not None else 0,
+        "readyReplicas": active_pods,
+        "availableReplicas": deployment.status.available_replicas if deployment.status.available_replicas is not None else 0,
+        "updatedReplicas": deployment.status.updated_replicas if deployment.status.updated_replicas is not None else 0,
+    })
+    return deployment_status_data, active_pods
+
+def _hpa_status_section(hpa) -> dict:
+    hpa_status_data = {"error": None}
+    if isinstance(hpa, ApiException):
+        e = hpa
+        if e.status == 404:
+            hpa_status_data["error"] = f"MI HPA '{MI_HPA_NAME}' not found."
+        else:
+            hpa_status_data["error"] = f"K8s API Error (HPA): {e.reason} (Status: {e.status})"
+        log.warning(hpa_status_data["error"])
+        return hpa_status_data
+
+    hpa_status_data.update({
+        "minReplicas": hpa.spec.min_replicas,
+        "maxReplicas": hpa.spec.max_replicas,
+        "currentReplicas": hpa.status.current_replicas if hpa.status and hpa.status.current_replicas is not None else 0,
+        "desiredReplicas": hpa.status.desired_replicas if hpa.status and hpa.status.desired_replicas is not None else 0,
+        "lastScaleTime": hpa.status.last_scale_time.isoformat() if hpa.status and hpa.status.last_scale_time else None,
+    })
+    return hpa_status_data
+
+def _cpu_usage_section(pod_metrics_list, active_pods: int, deployment_error: str | None) -> tuple[float, str | None, bool]:
+    """Returns (total_cpu_millicores, metrics_error_message, metrics_stale)."""
+    # The metrics result is discarded if the deployment read failed or no pods are ready.
+    if deployment_error:
+        return 0.0, None, False
+    if active_pods == 0:
+        return 0.0, "No active MI pods to fetch metrics from.", False
+
+    # Any failed refresh (API error or connection failure) falls back to the last value, flagged as stale.
+    if isinstance(pod_metrics_list, Exception):
+        e = pod_metrics_list
+        if not isinstance(e, ApiException):
+            metrics_error_message = _status_failure_message(e)
+        else:
+            if e.status == 404:
+                metrics_error_message = "Pod metrics not found. Ensure Metrics Server is running and MI pods are up with correct labels."
+            else:
+                metrics_error_message = f"K8s API Error (PodMetrics): {e.reason} (Status: {e.status})."
+            log.warning(metrics_error_message)
+        if _metrics_cache["ts"] is not None:
+            return _metrics_cache["value"], metrics_error_message, True
+        return 0.0, metrics_error_message, False
+    if pod_metrics_list is None:
+        return _metrics_cache["value"], None, False
+
+    total_cpu_millicores = sum(
+        parse_cpu_value(container_metrics.get("usage", _NO_USAGE).get("cpu", "0n"))
+        for item in pod_metrics_list.get("items", ())
+        for container_metrics in item.get("containers", ())
+        if container_metrics.get("name") == MI_CONTAINER_NAME
+    )
+    _metrics_cache.update(value=total_cpu_millicores, ts=time.monotonic())
+    return total_cpu_millicores, None, False
+
+async def get_mi_status():
+    current_timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    default_error_status = {
+        "timestamp": current_timestamp, "error": "Initial error state or K8s client not ready.",
+        "active_pods": 0, "total_cpu_millicores": 0, "metrics_stale": False,
+        "hpa_status": {"error": "Not fetched"}, "deployment_status": {"error": "Not fetched"}
+    }
+    
+    clients = _get_clients()
+    if clients is None:
+        log.warning("get_mi_status: Kubernetes client not initialized. Returning error status.")
+        default_error_status["error"] = "Kubernetes client not initialized on backend. Check K8s configuration and connection."
         return default_error_status
+
+    try:
+        # The reads are independent, so issue them concurrently.
+        deployment, hpa, pod_metrics_list = await asyncio.gather(
+            _read_deployment_status(clients), _read_hpa(clients), _read_pod_metrics(clients),
+            return_exceptions=True,
+        )
+        # Metrics failures of any kind are handled in _cpu_usage_section, which can fall back to the cached value.
+        _raise_unexpected(deployment, hpa)
+        deployment_status_data, active_pods = _deployment_status_section(deployment)
+        hpa_status_data = _hpa_status_section(hpa)
+        total_cpu_millicores, metrics_error_message, metrics_stale = _cpu_usage_section(
+            pod_metrics_list, active_pods, deployment_status_data["error"]
+        )
     except Exception as e:
-        import traceback
-        error_msg = f"Unexpected backend error in get_mi_status: {str(e)}"
-        print(error_msg)
-        traceback.print_exc()
-        default_error_status["error"] = error_msg
+        default_error_status["error"] = _status_failure_message(e)
         return default_error_status
     
     # Consolidate error messages for the final response
@@ -226,9 +440,53 @@ async def get_mi_status():
         "timestamp": current_timestamp,
         "active_pods": active_pods,
         "total_cpu_millicores": round(total_cpu_millicores, 2),
+        "metrics_stale": metrics_stale,
         "hpa_status": hpa_status_data,
         "deployment_status": deployment_status_data,
         "error": final_error_summary
     }
-    print(f"Status at {current_timestamp}: Active Pods: {active_pods}, CPU: {total_cpu_millicores:.2f}m. Error: {final_error_summary}")
+    log.debug("Status at %s: Active Pods: %d, CPU: %.2fm. Error: %s", current_timestamp, active_pods, total_cpu_millicores, final_error_summary)
     return response_data
+
+async def stream_mi_status():
+    """Yield the MI status one section at a time ("deployment", "hpa", "metrics") as each read resolves.
+
+    Used by the NDJSON endpoint so dashboards can render replica counts before the slower metrics
+    call returns. The metrics section always follows the deployment section, since it depends on
+    the ready-pod count. A connection-level failure yields a final "error" section.
+    """
+    current_timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    clients = _get_clients()
+    if clients is None:
+        yield {"timestamp": current_timestamp, "section": "error",
+               "error": "Kubernetes client not initialized on backend. Check K8s configuration and connection."}
+        return
+
+    deployment_task = asyncio.create_task(_read_deployment_status(clients))
+    hpa_task = asyncio.create_task(_read_hpa(clients))
+    metrics_task = asyncio.create_task(_read_pod_metrics(clients))
+    pending = {deployment_task, hpa_task}
+    try:
+        active_pods, deployment_error = 0, None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.exception() or task.result()
+                _raise_unexpected(result)
+                if task is deployment_task:
+                    deployment_status_data, active_pods = _deployment_status_section(result)
+                    deployment_error = deployment_status_data["error"]
+                    yield {"timestamp": current_timestamp, "section": "deployment",
+                           "active_pods": active_pods, "deployment_status": deployment_status_data}
+                else:
+                    yield {"timestamp": current_timestamp, "section": "hpa", "hpa_status": _hpa_status_section(result)}
+
+        pod_metrics_list = (await asyncio.gather(metrics_task, return_exceptions=True))[0]
+        total_cpu_millicores, metrics_error_message, metrics_stale = _cpu_usage_section(pod_metrics_list, active_pods, deployment_error)
+        yield {"timestamp": current_timestamp, "section": "metrics", "total_cpu_millicores": round(total_cpu_millicores, 2),
+               "metrics_stale": metrics_stale, "error": metrics_error_message}
+    except Exception as e:
+        yield {"timestamp": current_timestamp, "section": "error", "error": _status_failure_message(e)}
+    finally:
+        for task in (deployment_task, hpa_task, metrics_task):
+            task.cancel()
@@ -1,25 +1,47 @@
 # app/main.py
-from fastapi import FastAPI, HTTPException, Body, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Body
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Dict, Any 
+from fastapi.responses import Response, StreamingResponse
+from typing import Dict, Any 
 from .models import (
     NextJSDeploymentConfig, DeploymentResponse, 
     K6ConfigPayload, K6TestStatusResponse, K6Stage,
 )
-from .k8s_utils import apply_mi_configuration, get_mi_status, KUBE_CONFIG_LOADED
+from .k8s_utils import apply_mi_configuration, get_mi_status, stream_mi_status, start_status_watches, stop_status_watches, kube_config_loaded
 import uvicorn
-import traceback
-import subprocess
 import os
-import json
+import orjson
 import signal
-import re 
-import asyncio # Added for asyncio.to_thread
+import asyncio
+import logging
+import queue
+import contextlib
+import tempfile
+import shutil
+from logging.handlers import QueueHandler, QueueListener
+from dataclasses import dataclass, field
+from pathlib import Path
+from pydantic import TypeAdapter
+
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(levelname)s:     %(name)s - %(message)s")
+log = logging.getLogger(__name__)
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup and shutdown steps are defined under "Lifecycle" below; they only run once the module is loaded.
+    start_log_listener()
+    start_k8s_status_watches()
+    check_k6_script()
+    yield
+    await stop_active_k6_run()
+    stop_k8s_status_watches()
+    stop_log_listener()
 
 app = FastAPI(
     title="WSO2 MI Autoscaling Demo Backend",
     version="1.0.6", # Updated version
-    description="API to manage WSO2 MI deployment, trigger k6 load tests, and provide summaries."
+    description="API to manage WSO2 MI deployment, trigger k6 load tests, and provide summaries.",
+    lifespan=lifespan,
 )
 
 # --- CORS Configuration ---
@@ -30,179 +52,338 @@ app.add_middleware(
 )
 
 # --- Global state ---
-k6_process: subprocess.Popen | None = None
-k6_last_summary: Dict[str, Any] | None = None 
+@dataclass
+class K6Session:
+    """One k6 run. `state` moves running -> finishing -> done; no session at all means idle."""
+    # Set once k6 is spawned; a session only becomes app.state.k6 after that.
+    proc: asyncio.subprocess.Process | None = None
+    pidfd: int | None = None
+    state: str = "running"
+    summary: Dict[str, Any] | None = None
+    # Canonical K6_STAGES_JSON for this run, serialized once from the validated stages.
+    stages_env: str = ""
+    # Private per-run directory (mkdtemp, mode 0700) holding k6's summary file and its log.
+    run_dir: str = ""
+    # Set the moment k6 exits; lets the endpoints answer "is it running?" without a syscall or the lock.
+    exited: asyncio.Event = field(default_factory=asyncio.Event)
+
+# Current (or last finished) k6 run. State transitions happen under k6_lock so concurrent
+# start/stop requests can't both act on the same run.
+app.state.k6 = None
+app.state.k6_lock = asyncio.Lock()
+# What /api/load-test/status returns. Rebuilt only when a run starts or exits, so the polled endpoint does no work.
+app.state.status_cache = K6TestStatusResponse(is_running=False, message="No k6 test running or has finished.")
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+K6_SCRIPT_PATH = str(BASE_DIR / "k6-scripts" / "ramping_load_test.js")
+log.info("FastAPI K6_SCRIPT_PATH resolved to: %s", K6_SCRIPT_PATH)
+
+# Built once at import: each /start only layers the per-run keys on top instead of copying os.environ again.
+_BASE_K6_ENV = dict(os.environ)
+_BASE_K6_ENV_WITH_STATIC = {**_BASE_K6_ENV, "K6_PROMETHEUS_RW_SERVER_URL": "", "K6_NO_USAGE_REPORT": "true"}
+
+# Each run gets its own mkdtemp directory: k6's handleSummary writes the summary JSON to _K6_SUMMARY_FILE
+# there (passed as K6_SUMMARY_PATH), and k6's log output goes to _K6_LOG_FILE instead of the backend console.
+_K6_SUMMARY_FILE = "summary.json"
+_K6_LOG_FILE = "k6.log"
+# Serializes the validated stages straight from the models, without intermediate dicts.
+_STAGES_ADAPTER = TypeAdapter(list[K6Stage])
+
+# How long /stop waits for k6 to exit after SIGINT, then after SIGTERM, before escalating.
+K6_STOP_GRACE_SECONDS = 2.0
+K6_TERM_GRACE_SECONDS = 1.0
+
+# Upper bounds for the Kubernetes-backed endpoints; past these the client gets a 504.
+DEPLOY_TIMEOUT_SECONDS = 20.0
+# Strong references to in-flight deploy tasks, which may outlive the request that started them.
+_deploy_tasks: set[asyncio.Task] = set()
+
+def _log_orphaned_deploy(task: asyncio.Task):
+    if task.cancelled():
+        log.warning("MI deployment task was cancelled after its request timed out.")
+    elif task.exception() is not None:
+        log.error("MI deployment failed after its request timed out: %s", task.exception())
+    else:
+        log.info("MI deployment completed after its request timed out: %s", task.result())
+MI_STATUS_TIMEOUT_SECONDS = 5.0
+
+
+def watch_k6_exit(session: K6Session):
+    """Arrange for session.exited to be set when k6 exits, driven by the event loop rather than polling."""
+    loop = asyncio.get_running_loop()
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-K6_SCRIPT_PATH = os.path.join(BASE_DIR, "k6-scripts", "ramping_load_test.js")
-print(f"FastAPI K6_SCRIPT_PATH resolved to: {K6_SCRIPT_PATH}")
+    def mark_exited():
+        session.exited.set()
+        if app.state.k6 is session:
+            app.state.status_cache = K6TestStatusResponse(is_running=False, message="k6 load test has finished.", pid=session.proc.pid)
+
+    try:
+        # A pidfd becomes readable when the process exits (Linux >= 5.3).
+        session.pidfd = os.pidfd_open(session.proc.pid)
+    except (AttributeError, OSError):
+        # No pidfd support, or k6 already exited and was reaped: rely on asyncio's child watcher instead.
+        app.state.k6_exit_waiter = asyncio.create_task(session.proc.wait())
+        app.state.k6_exit_waiter.add_done_callback(lambda _: mark_exited())
+        return
 
+    def on_exit():
+        loop.remove_reader(session.pidfd)
+        os.close(session.pidfd)
+        session.pidfd = None
+        mark_exited()
+    loop.add_reader(session.pidfd, on_exit)
+
+def _read_k6_summary(path: str) -> Dict[str, Any] | None:
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        log.warning("k6 exited without writing a summary to %s", path)
+    except OSError as e:
+        log.error("Failed to read k6 summary from %s: %s", path, e)
+    except orjson.JSONDecodeError as e:
+        log.error("Failed to parse k6 summary JSON from %s: %s", path, e)
+    return None
+
+async def capture_k6_summary(session: K6Session):
+    # k6 logs to a file in its run directory, so there is nothing to drain while it runs.
+    try:
+        await session.exited.wait()
+        return_code = await session.proc.wait()
+        log.info("k6 process %s finished with code %s", session.proc.pid, return_code)
+        session.summary = _read_k6_summary(os.path.join(session.run_dir, _K6_SUMMARY_FILE))
+    finally:
+        # Only now is the summary final; /summary keys off this state. Set it unconditionally (a plain assignment
+        # needs no lock on the loop), so a failed read or a cancelled task can't leave /start refusing new runs.
+        session.state = "done"
 
-def parse_and_validate_stages(stages_json_str: str) -> List[K6Stage]:
+async def _wait_for_k6_exit(process: asyncio.subprocess.Process, pgid: int):
+    # SIGINT (already sent) lets k6 write its summary. If it hasn't exited within the grace period, escalate so
+    # a wedged run can't outlive the stop.
     try:
-        stages_list = json.loads(stages_json_str)
-        if not isinstance(stages_list, list): raise ValueError("Stages JSON must be an array.")
-        return [K6Stage(**stage_dict) for stage_dict in stages_list]
-    except json.JSONDecodeError as e: raise ValueError(f"Invalid JSON for stages: {e}")
-    except Exception as e: raise ValueError(f"Invalid stage config: {e}")
-
-# Function to run blocking IO in a separate thread
-def blocking_read_stream(stream):
-    lines = []
-    if stream:
-        for line in iter(stream.readline, ''):
-            lines.append(line.strip())
-        stream.close()
-    return lines
-
-def blocking_process_wait(process: subprocess.Popen):
-    return process.wait()
-
-async def log_k6_output_and_capture_summary(process: subprocess.Popen):
-    global k6_last_summary, k6_process
-    
-    summary_regex = re.compile(r"K6_SUMMARY_JSON_START(.*)K6_SUMMARY_JSON_END")
-    
-    # Read stdout and stderr in separate threads to avoid blocking
-    stdout_lines = await asyncio.to_thread(blocking_read_stream, process.stdout)
-    stderr_lines = await asyncio.to_thread(blocking_read_stream, process.stderr)
-
-    for line in stdout_lines:
-        print(f"[k6_stdout] {line}")
-        match = summary_regex.search(line)
-        if match:
-            summary_json_str = match.group(1)
-            try:
-                k6_last_summary = json.loads(summary_json_str)
-                print(f"[k6_summary_captured] Successfully parsed k6 summary JSON.")
-            except json.JSONDecodeError as e:
-                print(f"[k6_summary_error] Failed to parse k6 summary JSON: {e}")
-                print(f"[k6_summary_error] Offending string part: {summary_json_str[:200]}...")
-    
-    for line in stderr_lines:
-        print(f"[k6_stderr] {line}")
-    
-    return_code = await asyncio.to_thread(blocking_process_wait, process)
-    print(f"k6 process {process.pid} finished with code {return_code}")
-    
-    if k6_process and k6_process.pid == process.pid:
-        k6_process = None 
+        await asyncio.wait_for(process.wait(), K6_STOP_GRACE_SECONDS)
+    except asyncio.TimeoutError:
+        log.warning("k6 process %s still running %ss after SIGINT; sending SIGTERM", process.pid, K6_STOP_GRACE_SECONDS)
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(pgid, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(process.wait(), K6_TERM_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            log.warning("k6 process %s ignored SIGTERM; sending SIGKILL", process.pid)
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(pgid, signal.SIGKILL)
+            await process.wait()
+
+# --- Lifecycle ---
+def start_log_listener():
+    # Hand the root handlers to a QueueListener thread: on the event loop a log call only enqueues the record,
+    # so a slow stderr can't stall request handling.
+    root = logging.getLogger()
+    handlers = [h for h in root.handlers if not isinstance(h, QueueHandler)]
+    if not handlers:
+        return
+    log_queue = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    app.state.log_queue_handler = QueueHandler(log_queue)
+    root.addHandler(app.state.log_queue_handler)
+    app.state.log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    app.state.log_listener.start()
+
+def start_k8s_status_watches():
+    start_status_watches()
+    # urllib3 is HTTP/1.1 only, so there is no HTTP/2 multiplexing to lean on. Instead, run one status read
+    # in the background so the first dashboard poll finds warm apiserver connections and a filled metrics cache.
+    app.state.k8s_prewarm_task = asyncio.create_task(get_mi_status())
+
+def check_k6_script():
+    # K6_SCRIPT_PATH is fixed for the life of the process, so stat it once rather than on every /start.
+    app.state.k6_script_ok = os.path.isfile(K6_SCRIPT_PATH)
+    if not app.state.k6_script_ok:
+        log.warning("k6 script not found at %s; /api/load-test/start will fail.", K6_SCRIPT_PATH)
+
+async def stop_active_k6_run():
+    # k6 runs in its own session, so Ctrl+C on the backend never reaches it. Stop it here rather than leave
+    # it load-testing the target after the backend is gone.
+    session: K6Session | None = app.state.k6
+    if not session:
+        return
+    if not session.exited.is_set():
+        log.info("Backend shutting down; stopping k6 process PID: %s", session.proc.pid)
+        try:
+            pgid = os.getpgid(session.proc.pid)
+            os.killpg(pgid, signal.SIGINT)
+        except ProcessLookupError:
+            pass
+        else:
+            session.state = "finishing"
+            await _wait_for_k6_exit(session.proc, pgid)
+    shutil.rmtree(session.run_dir, ignore_errors=True)
+
+def stop_k8s_status_watches():
+    stop_status_watches()
+
+def stop_log_listener():
+    # Flush what is queued, then hand the original handlers back to the root logger so a later startup
+    # (e.g. a second TestClient in the same process) finds them and logging keeps working in between.
+    listener = getattr(app.state, "log_listener", None)
+    if not listener:
+        return
+    listener.stop()
+    root = logging.getLogger()
+    root.removeHandler(app.state.log_queue_handler)
+    for handler in listener.handlers:
+        root.addHandler(handler)
+    app.state.log_listener = None
+    app.state.log_queue_handler = None
 
 # --- API Endpoints ---
 @app.post("/api/deploy-mi", response_model=DeploymentResponse, tags=["MI Deployment"])
 async def deploy_micro_integrator(payload: NextJSDeploymentConfig = Body(...)):
-    if not KUBE_CONFIG_LOADED:
+    if not kube_config_loaded():
         raise HTTPException(status_code=503, detail="Kubernetes client not initialized on backend.")
-    print(f"Received MI deployment payload: {payload.dict(by_alias=True)}") 
-    if payload.maxReplicas < payload.minReplicas:
-        raise HTTPException(status_code=400, detail="maxReplicas < minReplicas.")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Received MI deployment payload: %s", payload.model_dump_json(exclude_unset=True))
     try:
-        result_details = await apply_mi_configuration(payload)
+        # The patches run in their own task behind a shield: a client disconnect or the timeout only stops this
+        # request waiting, the deployment and HPA patches still both get applied.
+        deploy_task = asyncio.create_task(apply_mi_configuration(payload))
+        _deploy_tasks.add(deploy_task)
+        deploy_task.add_done_callback(_deploy_tasks.discard)
+        result_details = await asyncio.wait_for(asyncio.shield(deploy_task), DEPLOY_TIMEOUT_SECONDS)
         return DeploymentResponse(
             message="WSO2 MI configuration submitted. Changes are being applied.",
             details=result_details
         )
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
+    except asyncio.TimeoutError:
+        # Nobody awaits the task any more, so its outcome would otherwise never surface anywhere.
+        deploy_task.add_done_callback(_log_orphaned_deploy)
+        raise HTTPException(status_code=504, detail=f"Kubernetes API did not respond within {DEPLOY_TIMEOUT_SECONDS}s; the changes are still being applied.")
     except Exception as e:
-        traceback.print_exc()
+        log.exception("Unexpected error during MI deployment")
         raise HTTPException(status_code=500, detail=f"Unexpected error during MI deployment: {str(e)}")
 
 
 @app.get("/api/mi-status", tags=["MI Status"])
 async def get_current_mi_status_endpoint():
     try:
-        status = await get_mi_status()
-        return status 
+        status = await asyncio.wait_for(get_mi_status(), MI_STATUS_TIMEOUT_SECONDS)
+        # Plain dict with no response_model: encode it with orjson directly rather than via jsonable_encoder.
+        return Response(orjson.dumps(status), media_type="application/json")
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail=f"MI status not available within {MI_STATUS_TIMEOUT_SECONDS}s.")
     except Exception as e: 
-        traceback.print_exc()
+        log.exception("Failed to fetch MI status")
         raise HTTPException(status_code=500, detail=f"Failed to fetch MI status: {str(e)}")
 
+@app.get("/api/mi-status/stream", tags=["MI Status"])
+async def stream_current_mi_status_endpoint():
+    # NDJSON variant of /api/mi-status: one JSON object per line, flushed as each section resolves.
+    async def ndjson_lines():
+        async for section in stream_mi_status():
+            yield orjson.dumps(section, option=orjson.OPT_APPEND_NEWLINE)
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson", headers={"Cache-Control": "no-store"})
+
 @app.post("/api/load-test/start", response_model=K6TestStatusResponse, tags=["Load Test"])
-async def start_load_test(background_tasks: BackgroundTasks, payload: K6ConfigPayload = Body(...)):
-    global k6_process, k6_last_summary
-    if k6_process and k6_process.poll() is None:
-        raise HTTPException(status_code=400, detail="A k6 load test is already running.")
-    
-    k6_last_summary = None 
+async def start_load_test(payload: K6ConfigPayload = Body(...)):
+    async with app.state.k6_lock:
+        previous: K6Session | None = app.state.k6
+        if previous and previous.state != "done":
+            raise HTTPException(status_code=400, detail="A k6 load test is already running.")
 
-    try:
-        validated_stages = parse_and_validate_stages(payload.stages_json)
-        stages_json_for_k6 = payload.stages_json
-        print(f"Starting k6: Target: {payload.target_url}, Stages: {stages_json_for_k6}")
-        if not os.path.exists(K6_SCRIPT_PATH):
-            raise HTTPException(status_code=500, detail=f"k6 script not found: {K6_SCRIPT_PATH}")
-
-        k6_env = os.environ.copy()
-        k6_env.update({
-            "K6_TARGET_URL": payload.target_url, "K6_STAGES_JSON": stages_json_for_k6,
-            "K6_PROMETHEUS_RW_SERVER_URL": "", "K6_NO_USAGE_REPORT": "true"
-        })
-        cmd = ["k6", "run", K6_SCRIPT_PATH]
-        k6_process = subprocess.Popen(cmd, env=k6_env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1) 
-        
-        background_tasks.add_task(log_k6_output_and_capture_summary, k6_process)
-
-        return K6TestStatusResponse(is_running=True, message="k6 load test started.", pid=k6_process.pid)
-    except ValueError as ve: raise HTTPException(status_code=400, detail=str(ve))
-    except Exception as e:
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Failed to start k6: {str(e)}")
+        session = K6Session(stages_env=_STAGES_ADAPTER.dump_json(payload.stages).decode())
+        try:
+            log.info("Starting k6: Target: %s, Stages: %s", payload.target_url, session.stages_env)
+            # Re-check under --reload/debug so a script edited or moved during development is picked up.
+            if not (app.state.k6_script_ok or (app.debug and os.path.isfile(K6_SCRIPT_PATH))):
+                raise HTTPException(status_code=500, detail=f"k6 script not found: {K6_SCRIPT_PATH}")
+
+            # A fresh private directory per run: nothing else can pre-create or symlink the summary path, and a
+            # previous run's summary can never pass for this one's.
+            session.run_dir = tempfile.mkdtemp(prefix="k6-run-")
+            k6_log_path = os.path.join(session.run_dir, _K6_LOG_FILE)
+            k6_env = {
+                **_BASE_K6_ENV_WITH_STATIC, "K6_TARGET_URL": payload.target_url, "K6_STAGES_JSON": session.stages_env,
+                "K6_SUMMARY_PATH": os.path.join(session.run_dir, _K6_SUMMARY_FILE),
+            }
+            cmd = ["k6", "run", f"--log-output=file={k6_log_path}", K6_SCRIPT_PATH]
+            session.proc = await asyncio.create_subprocess_exec(
+                *cmd, env=k6_env, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+                # Own process group, so stop can signal k6 together with anything it spawned.
+                start_new_session=True,
+            )
+        except HTTPException: raise
+        except Exception as e:
+            log.exception("Failed to start k6")
+            if session.run_dir:
+                shutil.rmtree(session.run_dir, ignore_errors=True)
+            raise HTTPException(status_code=500, detail=f"Failed to start k6: {str(e)}")
+        pid = session.proc.pid
+        log.info("k6 process %s started; log output in %s", pid, k6_log_path)
+
+        # The previous run's summary is kept in memory until now; its directory is no longer needed.
+        if previous:
+            shutil.rmtree(previous.run_dir, ignore_errors=True)
+
+        app.state.k6 = session
+        app.state.status_cache = K6TestStatusResponse(is_running=True, message="k6 load test is running.", pid=pid)
+        watch_k6_exit(session)
+    # A standalone task rather than a BackgroundTask: uvicorn waits for in-flight requests (background tasks
+    # included) before running shutdown hooks, which would keep stop_active_k6_run from ever firing.
+    app.state.k6_capture_task = asyncio.create_task(capture_k6_summary(session))
+
+    return K6TestStatusResponse(is_running=True, message="k6 load test started.", pid=pid)
 
 @app.post("/api/load-test/stop", response_model=K6TestStatusResponse, tags=["Load Test"])
 async def stop_load_test():
-    global k6_process
-    if not (k6_process and k6_process.poll() is None):
-        if k6_process: k6_process = None 
-        return K6TestStatusResponse(is_running=False, message="No k6 test running or already finished.")
-    try:
-        pid = k6_process.pid
-        print(f"Stopping k6 process PID: {pid}")
-        k6_process.send_signal(signal.SIGINT)
-        # The background task will handle process cleanup.
-        # For immediate UI feedback, we can assume it will stop.
-        # A more robust solution might involve waiting for the background task or k6_process.wait()
-        # but that would make this 'stop' endpoint blocking.
-        # Let the polling of /api/load-test/status update the final state.
-        return K6TestStatusResponse(is_running=False, message=f"Stop signal sent to k6 test (PID: {pid}). It will terminate shortly.", pid=pid)
-    except Exception as e:
-        traceback.print_exc()
-        current_pid = k6_process.pid if k6_process else None
-        # Don't set k6_process to None here if stop signal failed, let polling handle it.
-        raise HTTPException(status_code=500, detail=f"Failed to send stop signal to k6 (PID: {current_pid}): {str(e)}")
+    async with app.state.k6_lock:
+        session: K6Session | None = app.state.k6
+        if not session or session.state != "running" or session.exited.is_set():
+            return K6TestStatusResponse(is_running=False, message="No k6 test running or already finished.")
+        pid = session.proc.pid
+        try:
+            log.info("Stopping k6 process PID: %s", pid)
+            pgid = os.getpgid(pid)
+            os.killpg(pgid, signal.SIGINT)
+        except ProcessLookupError:
+            # k6 exited (and was reaped) after the check above; nothing left to stop.
+            return K6TestStatusResponse(is_running=False, message="No k6 test running or already finished.", pid=pid)
+        except Exception as e:
+            log.exception("Failed to send stop signal to k6 (PID: %s)", pid)
+            raise HTTPException(status_code=500, detail=f"Failed to send stop signal to k6 (PID: {pid}): {str(e)}")
+        # k6 still has to flush its summary; the background task moves the session on to "done".
+        session.state = "finishing"
+
+    await _wait_for_k6_exit(session.proc, pgid)
+    return K6TestStatusResponse(is_running=False, message=f"k6 test (PID: {pid}) stopped.", pid=pid)
 
 
 @app.get("/api/load-test/status", response_model=K6TestStatusResponse, tags=["Load Test"])
 async def get_load_test_status():
-    global k6_process
-    if k6_process and k6_process.poll() is None: 
-        return K6TestStatusResponse(is_running=True, message="k6 load test is running.", pid=k6_process.pid)
-    
-    # If k6_process is not None here, it means it has finished (poll() is not None).
-    # The background task `log_k6_output_and_capture_summary` is responsible for setting k6_process to None.
-    # If this endpoint is called before the background task completes that, we might report it as finished.
-    if k6_process and k6_process.poll() is not None:
-        # It's better to let the background task clear k6_process to avoid race conditions
-        # with summary capture. For now, just report based on poll().
-        return K6TestStatusResponse(is_running=False, message="k6 load test has finished.", pid=k6_process.pid)
-        
-    return K6TestStatusResponse(is_running=False, message="No k6 test running or has finished.")
+    return app.state.status_cache
 
 
 @app.get("/api/load-test/summary", response_model=Dict[str, Any], tags=["Load Test"])
 async def get_load_test_summary():
-    global k6_last_summary
-    if k6_last_summary:
-        return k6_last_summary
-    else:
-        status_msg = "No summary available. Test may not have completed, is still running, or summary was not captured."
-        if k6_process and k6_process.poll() is None:
-            status_msg = "Load test is currently running. Summary will be available after completion."
-        raise HTTPException(status_code=404, detail=status_msg)
+    session: K6Session | None = app.state.k6
+    if session and session.state == "done" and session.summary:
+        return session.summary
+    status_msg = "No summary available. Test may not have completed, is still running, or summary was not captured."
+    if session and session.state != "done":
+        status_msg = "Load test is currently running. Summary will be available after completion."
+    raise HTTPException(status_code=404, detail=status_msg)
 
 
 @app.get("/", tags=["Root"])
 async def read_root(): return {"message": "Welcome!"}
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    # uvloop + httptools instead of the stdlib loop and h11. The k6 session and the caches above live in this
+    # process, so WEB_CONCURRENCY defaults to 1: with more workers /start and /status could land on different ones.
+    # UVICORN_RELOAD=1 brings back auto-reload for development (uvicorn then ignores workers).
+    uvicorn.run(
+        "app.main:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")), reload=os.getenv("UVICORN_RELOAD") == "1",
+    )
@@ -306,7 +306,10 @@ export default function HomePage() {
         body: JSON.stringify(payloadToSend),
       });
       const data = await response.json();
-      if (!response.ok) throw new Error(data.detail || data.message || 'Failed to start k6 test');
+      if (!response.ok) {
+        const errorDetail = data.detail ? (Array.isArray(data.detail) ? data.detail.map((err: any) => `${err.loc.join('.')}: ${err.msg}`).join('; ') : data.detail) : (data.message || 'Failed to start k6 test');
+        throw new Error(errorDetail);
+      }
       setK6StatusMessage(data.message || "k6 load test started.");
       setIsK6Running(true); 
       isK6RunningRef.current = true; // Immediately update ref
@@ -19,6 +19,8 @@ const PAYLOAD_DEFAULT = JSON.stringify({
 });
 
 const TARGET_URL = __ENV.K6_TARGET_URL || TARGET_URL_DEFAULT;
+// Set by the FastAPI backend, which reads the summary JSON from this file once k6 exits.
+const SUMMARY_PATH = __ENV.K6_SUMMARY_PATH;
 const K6_STAGES_JSON = __ENV.K6_STAGES_JSON;
 let K6_STAGES;
 
@@ -96,8 +98,7 @@ export default function () {
 export function handleSummary(data) {
   console.log('Preparing k6 summary data...');
 
-  // We want to output the summary as a single line of JSON to stdout
-  // so the FastAPI backend can easily parse it.
+  // Condensed summary for the dashboard; the FastAPI backend reads it from SUMMARY_PATH.
   const summaryData = {
     total_requests: data.metrics['http_reqs'] ? data.metrics['http_reqs'].values.count : 0,
     failed_requests: data.metrics['http_req_failed'] ? data.metrics['http_req_failed'].values.fails : 0,
@@ -117,18 +118,14 @@ export function handleSummary(data) {
     data_received_bytes: data.metrics['data_received'] ? data.metrics['data_received'].values.count : 0,
   };
 
-  // Output the summary data as a JSON string to stdout
-  // Prepend with a specific marker so backend can identify it.
   const summaryJSON = JSON.stringify(summaryData);
-  console.log(`K6_SUMMARY_JSON_START${summaryJSON}K6_SUMMARY_JSON_END`);
-
-  // k6 also requires handleSummary to return an object for its own reporting or cloud services.
-  // We can return a simple object or a path to a file.
-  return {
-    'stdout': '', // Suppress default summary to stdout if we are logging our JSON
-    // Or, you can save the detailed summary to a file if needed:
-    // "summary.json": JSON.stringify(data, null, 2), 
-  };
+
+  // k6 writes each returned entry itself: the JSON goes to SUMMARY_PATH (or stdout when run by hand),
+  // replacing the default text summary.
+  if (SUMMARY_PATH) {
+    return { [SUMMARY_PATH]: summaryJSON, 'stdout': '' };
+  }
+  return { 'stdout': summaryJSON + '\n' };
 }
 
 export function teardown(data) {